@@ -1,9 +1,28 @@
-import inspect
-
 from aiohttp import web
 
 from ledfx.utils import BaseRegistry, RegistryLoader
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+HTTP_METHODS = ("get", "put", "post", "delete")
+
+
+def json_response(data, status=200) -> web.Response:
+    """
+    Returns a JSON response, serialized with orjson when it is installed
+    (pip install ledfx[fast]) and by aiohttp's json_response otherwise.
+    """
+    if orjson is None:
+        return web.json_response(data=data, status=status)
+    return web.Response(
+        body=orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS),
+        status=status,
+        content_type="application/json",
+    )
+
 
 @BaseRegistry.no_registration
 class RestEndpoint(BaseRegistry):
@@ -11,22 +30,54 @@ class RestEndpoint(BaseRegistry):
         self._ledfx = ledfx
 
     async def handler(self, request: web.Request):
-        method = getattr(self, request.method.lower(), None)
-        if not method:
-            raise web.HTTPMethodNotAllowed("")
+        """Generic dispatch for methods not covered by a specialised route"""
+        try:
+            method, wanted_args = self._method_map[request.method]
+        except KeyError:
+            raise web.HTTPMethodNotAllowed(
+                request.method, list(self._method_map)
+            )
 
-        wanted_args = list(inspect.signature(method).parameters.keys())
         available_args = request.match_info.copy()
         available_args.update({"request": request})
 
-        unsatisfied_args = set(wanted_args) - set(available_args.keys())
-        if unsatisfied_args:
-            raise web.HttpBadRequest("")
+        for arg_name in wanted_args:
+            if arg_name not in available_args:
+                raise web.HTTPBadRequest()
 
         return await method(
             **{arg_name: available_args[arg_name] for arg_name in wanted_args}
         )
 
+    def route_handler(self, http_method, path_args):
+        """
+        Returns an aiohttp handler for the given HTTP method. Handlers whose
+        arguments can be determined up front are bound directly to the
+        method, everything else falls back to the generic handler.
+        """
+        method, wanted_args = self._method_map[http_method]
+        wanted_args = set(wanted_args)
+
+        if not wanted_args:
+
+            async def route_handler(request):
+                return await method()
+
+        elif wanted_args == path_args:
+
+            async def route_handler(request):
+                return await method(**request.match_info)
+
+        elif wanted_args == path_args | {"request"}:
+
+            async def route_handler(request):
+                return await method(request=request, **request.match_info)
+
+        else:
+            route_handler = self.handler
+
+        return route_handler
+
 
 class RestApi(RegistryLoader):
 
@@ -41,9 +92,33 @@ class RestApi(RegistryLoader):
         # Create the endpoints and register their routes
         for endpoint_type in self.types():
             endpoint = self.create(type=endpoint_type, ledfx=self._ledfx)
-            app.router.add_route(
-                "*",
-                endpoint.ENDPOINT_PATH,
-                endpoint.handler,
-                name="api_{}".format(endpoint_type),
+            resource = app.router.add_resource(
+                endpoint.ENDPOINT_PATH, name="api_{}".format(endpoint_type)
             )
+            pattern = resource.get_info().get("pattern")
+            path_args = set(pattern.groupindex) if pattern else set()
+
+            # Introspect the handler signatures once rather than per request
+            endpoint._method_map = {}
+            for method_name in HTTP_METHODS:
+                method = getattr(endpoint, method_name, None)
+                if method is not None:
+                    # Endpoint methods only take positional arguments, so the
+                    # names can be read off the code object after self
+                    code = method.__func__.__code__
+                    wanted_args = code.co_varnames[1 : code.co_argcount]
+                    endpoint._method_map[method_name.upper()] = (
+                        method,
+                        wanted_args,
+                    )
+
+            for http_method in endpoint._method_map:
+                resource.add_route(
+                    http_method,
+                    endpoint.route_handler(http_method, path_args),
+                )
+
+            # Anything else still has to reach this resource, otherwise
+            # aiohttp falls through to the frontend catch-all instead of
+            # answering 405 Method Not Allowed
+            resource.add_route("*", endpoint.handler)
@@ -4,7 +4,6 @@ import pyaudio
 from aiohttp import web
 
 from ledfx.api import RestEndpoint
-from ledfx.config import save_config
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -62,10 +61,7 @@ class AudioDevicesEndpoint(RestEndpoint):
         new_config["device_index"] = int(index)
         self._ledfx.config["audio"] = new_config
 
-        save_config(
-            config=self._ledfx.config,
-            config_dir=self._ledfx.config_dir,
-        )
+        await self._ledfx.async_save_config()
 
         if self._ledfx.audio:
             self._ledfx.audio.update_config(new_config)
@@ -3,6 +3,7 @@ import logging
 from aiohttp import web
 
 from ledfx.api import RestEndpoint
+from ledfx.config import RUNTIME_CONFIG_KEYS
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -12,6 +13,11 @@ class ConfigEndpoint(RestEndpoint):
     ENDPOINT_PATH = "/api/config"
 
     async def get(self) -> web.Response:
-        response = {"config": self._ledfx.config}
+        config = {
+            key: value
+            for key, value in self._ledfx.config.items()
+            if key not in RUNTIME_CONFIG_KEYS
+        }
+        response = {"config": config}
 
         return web.json_response(data=response, status=200)
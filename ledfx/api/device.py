@@ -3,7 +3,6 @@ import logging
 from aiohttp import web
 
 from ledfx.api import RestEndpoint
-from ledfx.config import save_config
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -54,14 +53,10 @@ class DeviceEndpoint(RestEndpoint):
         )
 
         # Update and save the configuration
-        for device in self._ledfx.config["devices"]:
-            if device["id"] == device_id:
-                device["config"] = device_config
-                break
-        save_config(
-            config=self._ledfx.config,
-            config_dir=self._ledfx.config_dir,
-        )
+        stored_config = self._ledfx.config["_devices_by_id"].get(device_id)
+        if stored_config is not None:
+            stored_config["config"] = device_config
+        await self._ledfx.async_save_config()
 
         response = {"status": "success"}
         return web.json_response(data=response, status=200)
@@ -81,10 +76,8 @@ class DeviceEndpoint(RestEndpoint):
             for device in self._ledfx.config["devices"]
             if device["id"] != device_id
         ]
-        save_config(
-            config=self._ledfx.config,
-            config_dir=self._ledfx.config_dir,
-        )
+        self._ledfx.config["_devices_by_id"].pop(device_id, None)
+        await self._ledfx.async_save_config()
 
         response = {"status": "success"}
         return web.json_response(data=response, status=200)
@@ -5,7 +5,6 @@ import voluptuous as vol
 from aiohttp import web
 
 from ledfx.api import RestEndpoint
-from ledfx.config import save_config
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -70,7 +69,7 @@ class EffectsEndpoint(RestEndpoint):
                     val = random.choice([True, False])
                 # Lists
                 elif isinstance(schema[setting], vol.validators.In):
-                    val = random.choice(schema[setting].container)
+                    val = random.choice(list(schema[setting].container))
                 # All (assuming coerce(float/int), range(min,max))
                 # NOTE: vol.coerce(float/int) does not give enough info for a random value to be generated!
                 # *** All effects should give a range! ***
@@ -96,17 +95,13 @@ class EffectsEndpoint(RestEndpoint):
         device.set_effect(effect)
 
         # Update and save the configuration
-        for device in self._ledfx.config["devices"]:
-            if device["id"] == device_id:
-                # if not ('effect' in device):
-                device["effect"] = {}
-                device["effect"]["type"] = effect_type
-                device["effect"]["config"] = effect_config
-                break
-        save_config(
-            config=self._ledfx.config,
-            config_dir=self._ledfx.config_dir,
-        )
+        device_config = self._ledfx.config["_devices_by_id"].get(device_id)
+        if device_config is not None:
+            device_config["effect"] = {
+                "type": effect_type,
+                "config": effect_config,
+            }
+        await self._ledfx.async_save_config()
 
         effect_response = {}
         effect_response["config"] = effect.config
@@ -142,17 +137,13 @@ class EffectsEndpoint(RestEndpoint):
         device.set_effect(effect)
 
         # Update and save the configuration
-        for device in self._ledfx.config["devices"]:
-            if device["id"] == device_id:
-                # if not ('effect' in device):
-                device["effect"] = {}
-                device["effect"]["type"] = effect_type
-                device["effect"]["config"] = effect_config
-                break
-        save_config(
-            config=self._ledfx.config,
-            config_dir=self._ledfx.config_dir,
-        )
+        device_config = self._ledfx.config["_devices_by_id"].get(device_id)
+        if device_config is not None:
+            device_config["effect"] = {
+                "type": effect_type,
+                "config": effect_config,
+            }
+        await self._ledfx.async_save_config()
 
         effect_response = {}
         effect_response["config"] = effect.config
@@ -171,15 +162,10 @@ class EffectsEndpoint(RestEndpoint):
         # Clear the effect
         device.clear_effect()
 
-        for device in self._ledfx.config["devices"]:
-            if device["id"] == device_id:
-                if "effect" in device:
-                    del device["effect"]
-                    break
-        save_config(
-            config=self._ledfx.config,
-            config_dir=self._ledfx.config_dir,
-        )
+        device_config = self._ledfx.config["_devices_by_id"].get(device_id)
+        if device_config is not None and "effect" in device_config:
+            del device_config["effect"]
+        await self._ledfx.async_save_config()
 
         response = {"status": "success", "effect": {}}
         return web.json_response(data=response, status=200)
@@ -2,12 +2,38 @@ import logging
 
 from aiohttp import web
 
-from ledfx.api import RestEndpoint
-from ledfx.config import save_config
-from ledfx.utils import generate_id
+from ledfx.api import RestEndpoint, json_response
+from ledfx.utils import deepfreeze, generate_id
 
 _LOGGER = logging.getLogger(__name__)
 
+PRESET_CATEGORIES = ("default_presets", "custom_presets")
+
+# Checks run in order against the body of a put request, each may rely on
+# the ones before it having passed. Whether the effect exists, the preset id
+# and whether the preset exists are then checked in put, in that order.
+_PUT_VALIDATORS = (
+    (
+        lambda data: data.get("category") is not None,
+        'Required attribute "category" was not provided',
+    ),
+    (
+        lambda data: data["category"] in PRESET_CATEGORIES,
+        'Category {category} is not "default_presets" or "custom_presets"',
+    ),
+    (
+        lambda data: data.get("effect_id") is not None,
+        'Required attribute "effect_id" was not provided',
+    ),
+)
+
+
+def _fail(reason, status=500) -> web.Response:
+    """Returns a failed status response with the given reason"""
+    return json_response(
+        data={"status": "failed", "reason": reason}, status=status
+    )
+
 
 class DevicePresetsEndpoint(RestEndpoint):
 
@@ -18,26 +44,15 @@ class DevicePresetsEndpoint(RestEndpoint):
         device = self._ledfx.devices.get(device_id)
         if device is None:
             response = {"not found": 404}
-            return web.json_response(data=response, status=404)
+            return json_response(data=response, status=404)
 
         if not device.active_effect:
-            response = {
-                "status": "failed",
-                "reason": "Device {} has no active effect".format(device),
-            }
-            return web.json_response(data=response, status=500)
+            return _fail("Device {} has no active effect".format(device))
 
         effect_id = device.active_effect.type
 
-        if effect_id in self._ledfx.config["default_presets"].keys():
-            default = self._ledfx.config["default_presets"][effect_id]
-        else:
-            default = {}
-
-        if effect_id in self._ledfx.config["custom_presets"].keys():
-            custom = self._ledfx.config["custom_presets"][effect_id]
-        else:
-            custom = {}
+        default = self._ledfx.default_presets.get(effect_id, {})
+        custom = self._ledfx.config["custom_presets"].get(effect_id, {})
 
         response = {
             "status": "success",
@@ -47,171 +62,152 @@ class DevicePresetsEndpoint(RestEndpoint):
             "custom_presets": custom,
         }
 
-        return web.json_response(data=response, status=200)
+        return json_response(data=response, status=200)
 
     async def put(self, device_id, request) -> web.Response:
         """set active effect of device to a preset"""
         device = self._ledfx.devices.get(device_id)
         if device is None:
             response = {"not found": 404}
-            return web.json_response(data=response, status=404)
+            return json_response(data=response, status=404)
 
         data = await request.json()
-        category = data.get("category")
-        effect_id = data.get("effect_id")
-        preset_id = data.get("preset_id")
-
-        if category is None:
-            response = {
-                "status": "failed",
-                "reason": 'Required attribute "category" was not provided',
-            }
-            return web.json_response(data=response, status=500)
+        for is_valid, reason in _PUT_VALIDATORS:
+            if not is_valid(data):
+                return _fail(reason.format(**data))
 
-        if category not in ["default_presets", "custom_presets"]:
-            response = {
-                "status": "failed",
-                "reason": 'Category {} is not "default_presets" or "custom_presets"'.format(
-                    category
-                ),
-            }
-            return web.json_response(data=response, status=500)
-
-        if effect_id is None:
-            response = {
-                "status": "failed",
-                "reason": 'Required attribute "effect_id" was not provided',
-            }
-            return web.json_response(data=response, status=500)
+        category = data["category"]
+        effect_id = data["effect_id"]
+        preset_id = data.get("preset_id")
 
-        if effect_id not in self._ledfx.config[category].keys():
-            response = {
-                "status": "failed",
-                "reason": "Effect {} does not exist in category {}".format(
+        if category == "default_presets":
+            presets = self._ledfx.default_presets
+        else:
+            presets = self._ledfx.config["custom_presets"]
+        if effect_id not in presets:
+            return _fail(
+                "Effect {} does not exist in category {}".format(
                     effect_id, category
-                ),
-            }
-            return web.json_response(data=response, status=500)
+                )
+            )
 
         if preset_id is None:
-            response = {
-                "status": "failed",
-                "reason": 'Required attribute "preset_id" was not provided',
-            }
-            return web.json_response(data=response, status=500)
+            return _fail('Required attribute "preset_id" was not provided')
 
-        if preset_id not in self._ledfx.config[category][effect_id].keys():
-            response = {
-                "status": "failed",
-                "reason": "Preset {} does not exist for effect {} in category {}".format(
+        preset = self._ledfx.preset_lookup.get(
+            (category, effect_id, preset_id)
+        )
+        if preset is None:
+            return _fail(
+                "Preset {} does not exist for effect {} in category {}".format(
                     preset_id, effect_id, category
-                ),
-            }
-            return web.json_response(data=response, status=500)
+                )
+            )
 
         # Create the effect and add it to the device
-        effect_config = self._ledfx.config[category][effect_id][preset_id][
-            "config"
-        ]
+        effect_config = preset["config"]
         effect = self._ledfx.effects.create(
             ledfx=self._ledfx, type=effect_id, config=effect_config
         )
         device.set_effect(effect)
 
         # Update and save the configuration
-        for device in self._ledfx.config["devices"]:
-            if device["id"] == device_id:
-                # if not ('effect' in device):
-                device["effect"] = {}
-                device["effect"]["type"] = effect_id
-                device["effect"]["config"] = effect_config
-                break
-        save_config(
-            config=self._ledfx.config,
-            config_dir=self._ledfx.config_dir,
-        )
+        device_config = self._ledfx.config["_devices_by_id"].get(device_id)
+        if device_config is not None:
+            device_config["effect"] = {
+                "type": effect_id,
+                "config": effect_config,
+            }
+        self._ledfx.request_config_save()
 
-        effect_response = {}
-        effect_response["config"] = effect.config
-        effect_response["name"] = effect.name
-        effect_response["type"] = effect.type
+        effect_response = {
+            "config": effect.config,
+            "name": effect.name,
+            "type": effect.type,
+        }
 
         response = {"status": "success", "effect": effect_response}
-        return web.json_response(data=response, status=200)
+        return json_response(data=response, status=200)
 
     async def post(self, device_id, request) -> web.Response:
         """save configuration of active device effect as a custom preset"""
         device = self._ledfx.devices.get(device_id)
         if device is None:
             response = {"not found": 404}
-            return web.json_response(data=response, status=404)
+            return json_response(data=response, status=404)
 
         if not device.active_effect:
-            response = {
-                "status": "failed",
-                "reason": "device {} has no active effect".format(device_id),
-            }
-            return web.json_response(data=response, status=404)
+            return _fail(
+                "device {} has no active effect".format(device_id), status=404
+            )
 
         data = await request.json()
         preset_name = data.get("name")
         if preset_name is None:
-            response = {
-                "status": "failed",
-                "reason": 'Required attribute "preset_name" was not provided',
-            }
-            return web.json_response(data=response, status=500)
+            return _fail('Required attribute "preset_name" was not provided')
 
         preset_id = generate_id(preset_name)
         effect_id = device.active_effect.type
+        effect_config = device.active_effect.config
+
+        # If an identical preset already exists, return it rather than
+        # storing a duplicate. The index may be stale if presets have since
+        # been changed, so check the preset still matches.
+        preset_key = (effect_id, deepfreeze(effect_config))
+        existing_id = self._ledfx.custom_preset_index.get(preset_key)
+        existing = (
+            self._ledfx.config["custom_presets"]
+            .get(effect_id, {})
+            .get(existing_id)
+        )
+        if existing is not None and existing["config"] == effect_config:
+            response = {
+                "status": "success",
+                "preset": {
+                    "id": existing_id,
+                    "name": existing["name"],
+                    "config": existing["config"],
+                },
+            }
+            return json_response(data=response, status=200)
 
         # If no presets for the effect, create a dict to store them
-        if effect_id not in self._ledfx.config["custom_presets"].keys():
+        if effect_id not in self._ledfx.config["custom_presets"]:
             self._ledfx.config["custom_presets"][effect_id] = {}
 
         # Update the preset if it already exists, else create it
-        self._ledfx.config["custom_presets"][effect_id][preset_id] = {}
-        self._ledfx.config["custom_presets"][effect_id][preset_id][
-            "name"
-        ] = preset_name
-        self._ledfx.config["custom_presets"][effect_id][preset_id][
-            "config"
-        ] = device.active_effect.config
-
-        save_config(
-            config=self._ledfx.config,
-            config_dir=self._ledfx.config_dir,
-        )
+        preset = {"name": preset_name, "config": effect_config}
+        self._ledfx.config["custom_presets"][effect_id][preset_id] = preset
+        lookup_key = ("custom_presets", effect_id, preset_id)
+        self._ledfx.preset_lookup[lookup_key] = preset
+        self._ledfx.custom_preset_index[preset_key] = preset_id
+
+        self._ledfx.request_config_save()
 
         response = {
             "status": "success",
             "preset": {
                 "id": preset_id,
                 "name": preset_name,
-                "config": device.active_effect.config,
+                "config": effect_config,
             },
         }
-        return web.json_response(data=response, status=200)
+        return json_response(data=response, status=200)
 
     async def delete(self, device_id) -> web.Response:
         """clear effect of a device"""
         device = self._ledfx.devices.get(device_id)
         if device is None:
             response = {"not found": 404}
-            return web.json_response(data=response, status=404)
+            return json_response(data=response, status=404)
 
         # Clear the effect
         device.clear_effect()
 
-        for device in self._ledfx.config["devices"]:
-            if device["id"] == device_id:
-                if "effect" in device:
-                    del device["effect"]
-                    break
-        save_config(
-            config=self._ledfx.config,
-            config_dir=self._ledfx.config_dir,
-        )
+        device_config = self._ledfx.config["_devices_by_id"].get(device_id)
+        if device_config is not None and "effect" in device_config:
+            del device_config["effect"]
+        self._ledfx.request_config_save()
 
         response = {"status": "success", "effect": {}}
-        return web.json_response(data=response, status=200)
+        return json_response(data=response, status=200)
@@ -3,7 +3,6 @@ import logging
 from aiohttp import web
 
 from ledfx.api import RestEndpoint
-from ledfx.config import save_config
 from ledfx.utils import generate_id
 
 _LOGGER = logging.getLogger(__name__)
@@ -68,17 +67,14 @@ class DevicesEndpoint(RestEndpoint):
         )
 
         # Update and save the configuration
-        self._ledfx.config["devices"].append(
-            {
-                "id": device.id,
-                "type": device.type,
-                "config": device.config,
-            }
-        )
-        save_config(
-            config=self._ledfx.config,
-            config_dir=self._ledfx.config_dir,
-        )
+        device_config = {
+            "id": device.id,
+            "type": device.type,
+            "config": device.config,
+        }
+        self._ledfx.config["devices"].append(device_config)
+        self._ledfx.config["_devices_by_id"][device.id] = device_config
+        await self._ledfx.async_save_config()
 
         response = {
             "status": "success",
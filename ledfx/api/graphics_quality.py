@@ -3,7 +3,6 @@ import logging
 from aiohttp import web
 
 from ledfx.api import RestEndpoint
-from ledfx.config import save_config
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -45,10 +44,7 @@ class GraphicsQualityEndpoint(RestEndpoint):
         # Update and save config
         self._ledfx.config["graphics_quality"] = graphics_quality
 
-        save_config(
-            config=self._ledfx.config,
-            config_dir=self._ledfx.config_dir,
-        )
+        await self._ledfx.async_save_config()
 
         # reopen all websockets with new graphics settings
 
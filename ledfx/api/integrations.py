@@ -4,7 +4,6 @@ import logging
 from aiohttp import web
 
 from ledfx.api import RestEndpoint
-from ledfx.config import save_config
 
 # from ledfx.api.websocket import WebsocketConnection
 from ledfx.utils import generate_id
@@ -75,10 +74,7 @@ class IntegrationsEndpoint(RestEndpoint):
             if _integration["id"] == integration.id:
                 _integration["active"] = not active
                 break
-        save_config(
-            config=self._ledfx.config,
-            config_dir=self._ledfx.config_dir,
-        )
+        await self._ledfx.async_save_config()
 
         response = {"status": "success"}
         return web.json_response(data=response, status=200)
@@ -110,9 +106,7 @@ class IntegrationsEndpoint(RestEndpoint):
         ]
 
         # Save the config
-        save_config(
-            config=self._ledfx.config, config_dir=self._ledfx.config_dir
-        )
+        await self._ledfx.async_save_config()
 
         response = {"status": "success"}
         return web.json_response(data=response, status=200)
@@ -193,10 +187,7 @@ class IntegrationsEndpoint(RestEndpoint):
                     break
                     # Update and save the configuration
 
-        save_config(
-            config=self._ledfx.config,
-            config_dir=self._ledfx.config_dir,
-        )
+        await self._ledfx.async_save_config()
 
         response = {"status": "success"}
         return web.json_response(data=response, status=200)
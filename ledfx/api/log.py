@@ -17,16 +17,19 @@ class LogEndpoint(RestEndpoint):
     ENDPOINT_PATH = "/api/log"
 
     def __init__(self, ledfx):
-        self.logwebsocket = LogWebsocket(ledfx, ledfx.logqueue)
+        self.logwebsocket = LogWebsocket(
+            ledfx, ledfx.logqueue, ledfx.logqueue_event
+        )
 
     async def get(self, request) -> web.Response:
         return await self.logwebsocket.handle(request)
 
 
 class LogWebsocket:
-    def __init__(self, ledfx, queue):
+    def __init__(self, ledfx, queue, event):
         self._ledfx = ledfx
         self._sender_queue = queue
+        self._sender_event = event
         self._socket = None
         self._receiver_task = None
         self._sender_task = None
@@ -57,9 +60,12 @@ class LogWebsocket:
 
             # keep sending and adding to history while socket open
             while not self._socket.closed:
-                msg = await self._sender_queue.get()
-                self.log_append(msg)
-                await self.send(msg)
+                await self._sender_event.wait()
+                self._sender_event.clear()
+                while self._sender_queue:
+                    msg = self._sender_queue.popleft()
+                    self.log_append(msg)
+                    await self.send(msg)
 
         except TypeError as e:
             if self._socket.closed:
@@ -3,7 +3,6 @@ import logging
 from aiohttp import web
 
 from ledfx.api import RestEndpoint
-from ledfx.config import save_config
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -13,6 +12,12 @@ class PresetsEndpoint(RestEndpoint):
 
     ENDPOINT_PATH = "/api/effects/{effect_id}/presets"
 
+    def _category_presets(self, category):
+        """Returns the presets stored under the given category"""
+        if category == "default_presets":
+            return self._ledfx.default_presets
+        return self._ledfx.config[category]
+
     async def get(self, effect_id) -> web.Response:
         """Get all presets for an effect"""
 
@@ -25,8 +30,8 @@ class PresetsEndpoint(RestEndpoint):
             }
             return web.json_response(data=response, status=500)
 
-        if effect_id in self._ledfx.config["default_presets"].keys():
-            default = self._ledfx.config["default_presets"][effect_id]
+        if effect_id in self._ledfx.default_presets.keys():
+            default = self._ledfx.default_presets[effect_id]
         else:
             default = {}
 
@@ -74,7 +79,7 @@ class PresetsEndpoint(RestEndpoint):
             }
             return web.json_response(data=response, status=500)
 
-        if effect_id not in self._ledfx.config[category].keys():
+        if effect_id not in self._category_presets(category).keys():
             response = {
                 "status": "failed",
                 "reason": "Effect {} does not exist in category {}".format(
@@ -99,7 +104,7 @@ class PresetsEndpoint(RestEndpoint):
             }
             return web.json_response(data=response, status=500)
 
-        if preset_id not in self._ledfx.config[category][effect_id].keys():
+        if preset_id not in self._category_presets(category)[effect_id].keys():
             response = {
                 "status": "failed",
                 "reason": "Preset {} does not exist for effect {} in category {}".format(
@@ -116,11 +121,8 @@ class PresetsEndpoint(RestEndpoint):
             return web.json_response(data=response, status=500)
 
         # Update and save config
-        self._ledfx.config[category][effect_id][preset_id]["name"] = name
-        save_config(
-            config=self._ledfx.config,
-            config_dir=self._ledfx.config_dir,
-        )
+        self._category_presets(category)[effect_id][preset_id]["name"] = name
+        await self._ledfx.async_save_config()
 
         response = {"status": "success"}
         return web.json_response(data=response, status=200)
@@ -163,7 +165,7 @@ class PresetsEndpoint(RestEndpoint):
             }
             return web.json_response(data=response, status=500)
 
-        if effect_id not in self._ledfx.config[category].keys():
+        if effect_id not in self._category_presets(category).keys():
             response = {
                 "status": "failed",
                 "reason": "Effect {} does not exist in category {}".format(
@@ -179,7 +181,7 @@ class PresetsEndpoint(RestEndpoint):
             }
             return web.json_response(data=response, status=500)
 
-        if preset_id not in self._ledfx.config[category][effect_id].keys():
+        if preset_id not in self._category_presets(category)[effect_id].keys():
             response = {
                 "status": "failed",
                 "reason": "Preset {} does not exist for effect {} in category {}".format(
@@ -189,13 +191,11 @@ class PresetsEndpoint(RestEndpoint):
             return web.json_response(data=response, status=500)
 
         # Delete the preset from configuration
-        del self._ledfx.config[category][effect_id][preset_id]
+        del self._category_presets(category)[effect_id][preset_id]
+        self._ledfx.preset_lookup.pop((category, effect_id, preset_id), None)
 
         # Save the config
-        save_config(
-            config=self._ledfx.config,
-            config_dir=self._ledfx.config_dir,
-        )
+        await self._ledfx.async_save_config()
 
         response = {"status": "success"}
         return web.json_response(data=response, status=200)
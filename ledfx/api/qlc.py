@@ -3,7 +3,6 @@ import logging
 from aiohttp import web
 
 from ledfx.api import RestEndpoint
-from ledfx.config import save_config
 from ledfx.events import Event
 
 _LOGGER = logging.getLogger(__name__)
@@ -115,10 +114,7 @@ class QLCEndpoint(RestEndpoint):
             if _integration["id"] == integration_id:
                 _integration["data"] = integration.data
                 break
-        save_config(
-            config=self._ledfx.config,
-            config_dir=self._ledfx.config_dir,
-        )
+        await self._ledfx.async_save_config()
 
         response = {"status": "success"}
         return web.json_response(data=response, status=200)
@@ -171,10 +167,7 @@ class QLCEndpoint(RestEndpoint):
             if _integration["id"] == integration_id:
                 _integration["data"] = integration.data
                 break
-        save_config(
-            config=self._ledfx.config,
-            config_dir=self._ledfx.config_dir,
-        )
+        await self._ledfx.async_save_config()
 
         response = {"status": "success"}
         return web.json_response(data=response, status=200)
@@ -219,10 +212,7 @@ class QLCEndpoint(RestEndpoint):
             if _integration["id"] == integration_id:
                 _integration["data"] = integration.data
                 break
-        save_config(
-            config=self._ledfx.config,
-            config_dir=self._ledfx.config_dir,
-        )
+        await self._ledfx.async_save_config()
 
         response = {"status": "success"}
         return web.json_response(data=response, status=200)
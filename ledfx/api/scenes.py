@@ -3,7 +3,6 @@ import logging
 from aiohttp import web
 
 from ledfx.api import RestEndpoint
-from ledfx.config import save_config
 from ledfx.events import SceneSetEvent
 from ledfx.utils import generate_id
 
@@ -46,10 +45,7 @@ class ScenesEndpoint(RestEndpoint):
         del self._ledfx.config["scenes"][scene_id]
 
         # Save the config
-        save_config(
-            config=self._ledfx.config,
-            config_dir=self._ledfx.config_dir,
-        )
+        await self._ledfx.async_save_config()
 
         response = {"status": "success"}
         return web.json_response(data=response, status=200)
@@ -134,10 +130,7 @@ class ScenesEndpoint(RestEndpoint):
 
             # Update and save config
             self._ledfx.config["scenes"][scene_id]["name"] = name
-            save_config(
-                config=self._ledfx.config,
-                config_dir=self._ledfx.config_dir,
-            )
+            await self._ledfx.async_save_config()
 
             response = {
                 "status": "success",
@@ -176,10 +169,7 @@ class ScenesEndpoint(RestEndpoint):
         # Update the scene if it already exists, else create it
         self._ledfx.config["scenes"][scene_id] = scene_config
 
-        save_config(
-            config=self._ledfx.config,
-            config_dir=self._ledfx.config_dir,
-        )
+        await self._ledfx.async_save_config()
 
         response = {
             "status": "success",
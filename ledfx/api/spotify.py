@@ -4,7 +4,6 @@ import logging
 from aiohttp import web
 
 from ledfx.api import RestEndpoint
-from ledfx.config import save_config
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -75,9 +74,7 @@ class QLCEndpoint(RestEndpoint):
 
         integration.add_trigger(scene_id, song_id, song_name, song_position)
 
-        save_config(
-            config=self._ledfx.config, config_dir=self._ledfx.config_dir
-        )
+        await self._ledfx.async_save_config()
 
         response = {"status": "success"}
         return web.json_response(data=response, status=200)
@@ -102,9 +99,7 @@ class QLCEndpoint(RestEndpoint):
         integration.delete_trigger(trigger_id)
 
         # Update and save the config
-        save_config(
-            config=self._ledfx.config, config_dir=self._ledfx.config_dir
-        )
+        await self._ledfx.async_save_config()
 
         response = {"status": "success"}
         return web.json_response(data=response, status=200)
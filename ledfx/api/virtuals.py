@@ -3,7 +3,6 @@ import logging
 from aiohttp import web
 
 from ledfx.api import RestEndpoint
-from ledfx.config import save_config
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -40,10 +39,7 @@ class VirtualsEndpoint(RestEndpoint):
         # Update and save the configuration
         self._ledfx.config["virtuals"] = virtuals_list
 
-        save_config(
-            config=self._ledfx.config,
-            config_dir=self._ledfx.config_dir,
-        )
+        await self._ledfx.async_save_config()
 
         response = {
             "status": "success",
@@ -1,16 +1,29 @@
+import copy
 import datetime
+import functools
 import json
 import logging
 import os
+import stat
 import sys
+import tempfile
+from dataclasses import dataclass
 
 import voluptuous as vol
 import yaml
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 CONFIG_DIRECTORY = ".ledfx"
 CONFIG_FILE_NAME = "config.json"
 OLD_CONFIG_FILE_NAME = "config.yaml"
 DEFAULT_PRESETS_FILE_NAME = "default_presets.json"
+CONFIG_WRITE_BUFFER_SIZE = 65536
+# Keys derived from the configuration at runtime which should not be saved
+RUNTIME_CONFIG_KEYS = frozenset({"_devices_by_id"})
 
 CORE_CONFIG_SCHEMA = vol.Schema(
     {
@@ -19,7 +32,6 @@ CORE_CONFIG_SCHEMA = vol.Schema(
         vol.Optional("dev_mode", default=False): bool,
         vol.Optional("crossfade", default=1.0): float,
         vol.Optional("devices", default=[]): list,
-        vol.Optional("default_presets", default={}): dict,
         vol.Optional("custom_presets", default={}): dict,
         vol.Optional("scenes", default={}): dict,
         vol.Optional("integrations", default=[]): list,
@@ -28,6 +40,18 @@ CORE_CONFIG_SCHEMA = vol.Schema(
     },
     extra=vol.ALLOW_EXTRA,
 )
+# The schema's defaults never change, so only materialise them once. Copy
+# before use, as voluptuous hands out the same default list/dict objects.
+_DEFAULT_CONFIG = CORE_CONFIG_SCHEMA({})
+
+
+@dataclass
+class ConfigPaths:
+    """Locations of the files the configuration is loaded from"""
+
+    config_dir: str
+    config_file: str
+    presets_file: str
 
 
 def load_logger():
@@ -35,6 +59,7 @@ def load_logger():
     _LOGGER = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
 def get_default_config_directory() -> str:
     """Get the default configuration directory"""
 
@@ -44,6 +69,21 @@ def get_default_config_directory() -> str:
     return os.path.join(base_dir, CONFIG_DIRECTORY)
 
 
+def get_config_paths(config_dir: str) -> ConfigPaths:
+    """
+    Resolves the configuration file locations for the provided directory.
+    The config file is where the configuration is saved, which is the JSON
+    file once the configuration has been loaded.
+    """
+
+    ledfx_dir = os.path.dirname(os.path.realpath(__file__))
+    return ConfigPaths(
+        config_dir=config_dir,
+        config_file=os.path.join(config_dir, CONFIG_FILE_NAME),
+        presets_file=os.path.join(ledfx_dir, DEFAULT_PRESETS_FILE_NAME),
+    )
+
+
 def get_config_file(config_dir: str) -> str:
     """Finds a supported configuration file in the provided directory"""
 
@@ -59,6 +99,7 @@ def get_config_file(config_dir: str) -> str:
     return json_path  # Return the JSON file if we find one.
 
 
+@functools.lru_cache(maxsize=1)
 def get_log_file_location():
     config_dir = get_default_config_directory()
     log_file_path = os.path.abspath(os.path.join(config_dir, "LedFx.log"))
@@ -70,14 +111,8 @@ def create_default_config(config_dir: str) -> str:
 
     config_path = os.path.join(config_dir, CONFIG_FILE_NAME)
     try:
-        with open(config_path, "w", encoding="utf-8") as file:
-            json.dump(
-                CORE_CONFIG_SCHEMA({}),
-                file,
-                ensure_ascii=False,
-                sort_keys=True,
-                indent=4,
-            )
+        with open(config_path, "wb") as file:
+            file.write(dump_config(_DEFAULT_CONFIG))
         return config_path
 
     except IOError:
@@ -136,6 +171,9 @@ def load_config(config_dir: str) -> dict:
 
         with open(config_file, encoding="utf-8") as file:
             config_json = json.load(file)
+            # Older versions stored the bundled default presets in the
+            # config, they are loaded from default_presets.json instead
+            config_json.pop("default_presets", None)
             return CORE_CONFIG_SCHEMA(config_json)
     except json.JSONDecodeError:
         date = datetime.date.today()
@@ -149,34 +187,77 @@ def load_config(config_dir: str) -> dict:
         _LOGGER.warning(
             f"Please check the backup for JSON errors if required - {backup_location}"
         )
-        return CORE_CONFIG_SCHEMA({})
+        return copy.deepcopy(_DEFAULT_CONFIG)
 
 
-def load_default_presets() -> dict:
-    ledfx_dir = os.path.dirname(os.path.realpath(__file__))
-    default_presets_path = os.path.join(ledfx_dir, DEFAULT_PRESETS_FILE_NAME)
-    print("Loading default presets from {}".format(ledfx_dir))
-    if not os.path.isfile(default_presets_path):
+def load_default_presets(default_presets_path: str) -> dict:
+    print("Loading default presets from {}".format(default_presets_path))
+    try:
+        with open(default_presets_path, encoding="utf-8") as file:
+            return json.load(file)
+    except FileNotFoundError:
         print("Failed to load {}".format(DEFAULT_PRESETS_FILE_NAME))
-    with open(default_presets_path, encoding="utf-8") as file:
-        return json.load(file)
+        raise
 
 
-def save_config(config: dict, config_dir: str) -> None:
-    """Saves the configuration to the provided directory"""
+def save_config(
+    config: dict, config_dir: str, config_file: str = None
+) -> None:
+    """
+    Saves the configuration to the provided directory. The config file is
+    resolved from the directory unless an already resolved path is given
+    """
 
-    config_file = ensure_config_file(config_dir)
+    if config_file is None:
+        config_file = ensure_config_file(config_dir)
     _LOGGER.info(("Saving configuration file to {}").format(config_dir))
-    # prevent defaults being saved to config.yaml by creating a copy (python
-    # no pass by value)
-    config_view = dict(config)
-    if "default_presets" in config_view.keys():
-        del config_view["default_presets"]
-    with open(config_file, "w", encoding="utf-8") as file:
-        json.dump(
-            config_view, file, ensure_ascii=False, sort_keys=True, indent=4
+    config_view = {
+        key: value
+        for key, value in config.items()
+        if key not in RUNTIME_CONFIG_KEYS
+    }
+    # Serialise up front so a config that can't be dumped fails before any
+    # temporary file exists
+    data = dump_config(config_view)
+    # Write to a uniquely named temporary file next to the config and swap
+    # it in, so an interrupted save can't leave a partially written
+    # configuration behind
+    temp_file = None
+    try:
+        fd, temp_file = tempfile.mkstemp(
+            dir=os.path.dirname(config_file),
+            prefix=f"{CONFIG_FILE_NAME}.",
+            suffix=".tmp",
+        )
+        with os.fdopen(fd, "wb", buffering=CONFIG_WRITE_BUFFER_SIZE) as file:
+            file.write(data)
+        # mkstemp creates the file owner-only, keep the existing permissions
+        if os.path.exists(config_file):
+            os.chmod(temp_file, stat.S_IMODE(os.stat(config_file).st_mode))
+        os.replace(temp_file, config_file)
+    except OSError as error:
+        _LOGGER.error(f"Unable to save configuration file: {error}")
+        if temp_file is not None and os.path.exists(temp_file):
+            os.remove(temp_file)
+
+
+def dump_config(config: dict) -> bytes:
+    """Serializes the configuration to UTF-8 encoded JSON"""
+
+    if orjson is not None:
+        return orjson.dumps(
+            config,
+            option=orjson.OPT_SORT_KEYS
+            | orjson.OPT_INDENT_2
+            | orjson.OPT_NON_STR_KEYS,
         )
 
+    # Match the orjson output exactly, so the saved file looks the same
+    # whether or not orjson is installed
+    return json.dumps(
+        config, ensure_ascii=False, sort_keys=True, indent=2
+    ).encode("utf-8")
+
 
 def migrate_config(config_dir, config_file):
     """Save the old configuration file as a new JSON object and resume the loading process"""
@@ -185,10 +266,8 @@ def migrate_config(config_dir, config_file):
     with open(config_file, "rt") as file:
         config_yaml = yaml.safe_load(file)
         json_config_file = os.path.join(config_dir, CONFIG_FILE_NAME)
-        with open(json_config_file, "w", encoding="utf-8") as file:
-            json.dump(
-                config_yaml, file, ensure_ascii=False, sort_keys=True, indent=4
-            )
+        with open(json_config_file, "wb") as file:
+            file.write(dump_config(config_yaml))
     try:
         old_config_location = os.path.join(
             config_dir, f"{datetime.date.today()}_config.yaml.backup"
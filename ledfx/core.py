@@ -1,31 +1,60 @@
 import asyncio
+import collections
 import logging
 import sys
 import warnings
 from concurrent.futures import ThreadPoolExecutor
 
-from ledfx.config import load_config, load_default_presets, save_config
-from ledfx.devices import Devices
-from ledfx.effects import Effects
+from ledfx.config import (
+    get_config_paths,
+    load_config,
+    load_default_presets,
+    save_config,
+)
 from ledfx.events import Events, LedFxShutdownEvent
 from ledfx.http_manager import HttpServer
-from ledfx.integrations import Integrations
 from ledfx.utils import (
     RollingQueueHandler,
     async_fire_and_forget,
     currently_frozen,
+    deepfreeze,
 )
 
 _LOGGER = logging.getLogger(__name__)
+# Delay in seconds used to coalesce bursts of configuration changes
+CONFIG_SAVE_DELAY = 0.5
+LOG_QUEUE_LENGTH = 100
 if currently_frozen():
     warnings.filterwarnings("ignore")
 
 
 class LedFxCore(object):
     def __init__(self, config_dir, host=None, port=None):
-        self.config_dir = config_dir
+        self.config_paths = get_config_paths(config_dir)
         self.config = load_config(config_dir)
-        self.config["default_presets"] = load_default_presets()
+        self.default_presets = load_default_presets(
+            self.config_paths.presets_file
+        )
+        # Flat view of every preset keyed by (category, effect id, preset id)
+        self.preset_lookup = {
+            (category, effect_id, preset_id): preset
+            for category, presets in (
+                ("default_presets", self.default_presets),
+                ("custom_presets", self.config["custom_presets"]),
+            )
+            for effect_id, effect_presets in presets.items()
+            for preset_id, preset in effect_presets.items()
+        }
+        self.config["_devices_by_id"] = {
+            device["id"]: device for device in self.config["devices"]
+        }
+        # Maps (effect id, frozen config) to the id of a matching custom
+        # preset, used to avoid saving duplicate presets
+        self.custom_preset_index = {
+            (effect_id, deepfreeze(preset["config"])): preset_id
+            for effect_id, presets in self.config["custom_presets"].items()
+            for preset_id, preset in presets.items()
+        }
         host = host if host else self.config["host"]
         port = port if port else self.config["port"]
 
@@ -35,6 +64,9 @@ class LedFxCore(object):
             self.loop = asyncio.get_event_loop()
 
         self.executor = ThreadPoolExecutor()
+        # Saves all write the same file, so they run one at a time and in
+        # the order they were requested
+        self.config_save_executor = ThreadPoolExecutor(max_workers=1)
         self.loop.set_default_executor(self.executor)
         self.loop.set_exception_handler(self.loop_exception_handler)
 
@@ -42,10 +74,42 @@ class LedFxCore(object):
         self.events = Events(self)
         self.http = HttpServer(ledfx=self, host=host, port=port)
         self.exit_code = None
+        self._config_save_handle = None
 
     def dev_enabled(self):
         return self.config["dev_mode"]
 
+    def request_config_save(self):
+        """
+        Schedules the configuration to be saved. Requests made while a save
+        is pending are coalesced into a single write, which is performed in
+        the executor to keep the event loop responsive.
+        """
+        if self._config_save_handle is None:
+            self._config_save_handle = self.loop.call_later(
+                CONFIG_SAVE_DELAY, self._flush_config
+            )
+
+    def _flush_config(self):
+        self._config_save_handle = None
+        async_fire_and_forget(self.async_save_config(), self.loop)
+
+    async def async_save_config(self):
+        """
+        Saves the configuration in the config save executor. A shallow copy
+        is taken so top level changes made while the save is in progress
+        don't race it.
+        """
+        await self.loop.run_in_executor(
+            self.config_save_executor,
+            save_config,
+            dict(self.config),
+            self.config_paths.config_dir,
+            # The config directory is guaranteed to exist once loaded, so
+            # the config file can be saved to directly
+            self.config_paths.config_file,
+        )
+
     def loop_exception_handler(self, loop, context):
         kwargs = {}
         exception = context.get("exception")
@@ -65,8 +129,11 @@ class LedFxCore(object):
         def log_filter(record):
             return (record.name != "ledfx.api.log") and (record.levelno >= 20)
 
-        self.logqueue = asyncio.Queue(maxsize=100, loop=self.loop)
-        logqueue_handler = RollingQueueHandler(self.logqueue)
+        self.logqueue = collections.deque(maxlen=LOG_QUEUE_LENGTH)
+        self.logqueue_event = asyncio.Event(loop=self.loop)
+        logqueue_handler = RollingQueueHandler(
+            self.logqueue, self.logqueue_event, self.loop
+        )
         logqueue_handler.addFilter(log_filter)
         root_logger = logging.getLogger()
         root_logger.addHandler(logqueue_handler)
@@ -106,6 +173,12 @@ class LedFxCore(object):
         return self.exit_code
 
     async def async_start(self, open_ui=False):
+        # Defer importing the component registries until they are needed,
+        # as they pull in most of the application
+        from ledfx.devices import Devices
+        from ledfx.effects import Effects
+        from ledfx.integrations import Integrations
+
         _LOGGER.info("Starting ledfx")
         await self.http.start()
 
@@ -167,10 +240,15 @@ class LedFxCore(object):
         ]
         list(map(lambda task: task.cancel(), tasks))
 
-        # Save the configuration before shutting down
-        save_config(config=self.config, config_dir=self.config_dir)
+        # Save the configuration before shutting down. The save is queued
+        # behind any save still in flight, so it is always the last write
+        if self._config_save_handle is not None:
+            self._config_save_handle.cancel()
+            self._config_save_handle = None
+        await self.async_save_config()
 
         await self.flush_loop()
+        self.config_save_executor.shutdown()
         self.executor.shutdown()
         self.exit_code = exit_code
         self.loop.stop()
@@ -9,7 +9,6 @@ import requests
 import voluptuous as vol
 import zeroconf
 
-from ledfx.config import save_config
 from ledfx.events import (
     DeviceUpdateEvent,
     EffectClearedEvent,
@@ -19,6 +18,9 @@ from ledfx.events import (
 from ledfx.utils import BaseRegistry, RegistryLoader, generate_id
 
 _LOGGER = logging.getLogger(__name__)
+DEVICE_UPDATE_INTERVAL = 1 / 30
+# Interval in seconds to resend the last frame while the effect is idle
+DEVICE_KEEPALIVE_INTERVAL = 1.0
 
 
 @BaseRegistry.no_registration
@@ -66,6 +68,11 @@ class Device(BaseRegistry):
     _output_thread = None
     _active_effect = None
     _fadeout_effect = None
+    _frame_perm = None
+    _last_update_event = 0
+    _pending_update_frame = None
+    _last_frame = None
+    _last_flush = 0
 
     def __init__(self, ledfx, config):
         self._ledfx = ledfx
@@ -141,29 +148,52 @@ class Device(BaseRegistry):
     def process_active_effect(self):
         # Assemble the frame if necessary, if nothing changed just sleep
         self.assembled_frame = self.assemble_frame()
-        if self.assembled_frame is not None:
+        now = time.monotonic()
+        if self.assembled_frame is None:
+            # Receivers such as WLED drop out of realtime mode when packets
+            # stop, so resend the last frame while the effect is idle
+            if (
+                self._last_frame is not None
+                and now - self._last_flush >= DEVICE_KEEPALIVE_INTERVAL
+                and not self._config["preview_only"]
+            ):
+                self._last_flush = now
+                self.flush(self._last_frame)
+        else:
+            self._last_frame = self.assembled_frame
             if not self._config["preview_only"]:
+                self._last_flush = now
                 self.flush(self.assembled_frame)
-
-            def trigger_device_update_event():
-                self._ledfx.events.fire_event(
-                    DeviceUpdateEvent(self.id, self.assembled_frame)
-                )
-
-            self._ledfx.loop.call_soon_threadsafe(trigger_device_update_event)
+            self._pending_update_frame = self.assembled_frame
+
+        # thread_function is scheduled on the event loop, so the event can
+        # be fired directly. Throttle it, as the previews don't need every
+        # frame and building the event converts the whole frame. A frame
+        # held back by the throttle is fired on a later tick, so the preview
+        # always ends up on the latest frame
+        if (
+            self._pending_update_frame is not None
+            and now - self._last_update_event >= DEVICE_UPDATE_INTERVAL
+        ):
+            self._last_update_event = now
+            self._ledfx.events.fire_event(
+                DeviceUpdateEvent(self.id, self._pending_update_frame)
+            )
+            self._pending_update_frame = None
 
     def thread_function(self):
         # TODO: Evaluate switching over to asyncio with UV loop optimization
         # instead of spinning a separate thread.
         if self._active:
-            sleep_interval = 1 / self._config["refresh_rate"]
-            start_time = time.time()
+            start_time = time.monotonic()
 
             self.process_active_effect()
 
             # Calculate the time to sleep accounting for potential heavy
             # frame assembly operations
-            time_to_sleep = sleep_interval - (time.time() - start_time)
+            time_to_sleep = self._frame_interval - (
+                time.monotonic() - start_time
+            )
             # print(1/time_to_sleep, end="\r") prints current fps
 
             self._ledfx.loop.call_later(time_to_sleep, self.thread_function)
@@ -194,16 +224,16 @@ class Device(BaseRegistry):
         if self._active_effect is None:
             return None
 
-        if self._active_effect._dirty:
+        # Keep assembling frames while a crossfade is running, even if the
+        # effect hasn't changed, otherwise the fade stalls part way through
+        if self._active_effect._dirty or self.fade_timer:
             # Get and process active effect frame
-            pixels = self._active_effect.get_pixels()
+            pixels = self._center_pixels(self._active_effect.get_pixels())
             frame = np.clip(
                 pixels * self._config["max_brightness"],
                 0,
                 255,
             )
-            if self._config["center_offset"]:
-                frame = np.roll(frame, self._config["center_offset"], axis=0)
             self._active_effect._dirty = self._config["force_refresh"]
 
             # Handle fading effect in/out if just turned on or off
@@ -213,6 +243,9 @@ class Device(BaseRegistry):
                 # if +ve fade timer, fade in the effect
                 frame *= 1 - (self.fade_timer / self.fade_duration)
                 self.fade_timer -= 1
+                # Make sure the fully faded in frame is sent as well
+                if self.fade_timer == 0:
+                    self._active_effect._dirty = True
             elif self.fade_timer < 0:
                 # if -ve fade timer, fade out the effect
                 frame *= -self.fade_timer / self.fade_duration
@@ -221,20 +254,16 @@ class Device(BaseRegistry):
         # This part handles blending two effects together
         fadeout_frame = None
         if self._fadeout_effect:
-            if self._fadeout_effect._dirty:
+            if self._fadeout_effect._dirty or self.fade_timer:
                 # Get and process fadeout effect frame
-                fadeout_frame = np.clip(
+                fadeout_pixels = self._center_pixels(
                     self._fadeout_effect.pixels
-                    * self._config["max_brightness"],
+                )
+                fadeout_frame = np.clip(
+                    fadeout_pixels * self._config["max_brightness"],
                     0,
                     255,
                 )
-                if self._config["center_offset"]:
-                    fadeout_frame = np.roll(
-                        fadeout_frame,
-                        self._config["center_offset"],
-                        axis=0,
-                    )
                 self._fadeout_effect._dirty = self._config["force_refresh"]
 
                 # handle fading out the fadeout frame
@@ -247,7 +276,32 @@ class Device(BaseRegistry):
 
         return frame
 
+    def _center_pixels(self, pixels):
+        """Rotates the pixels by the configured center offset"""
+        if self._frame_perm is None:
+            return pixels
+        # The permutation is always in range, and unlike the default "raise"
+        # mode "clip" lets numpy gather straight into the buffer
+        return np.take(
+            pixels,
+            self._frame_perm,
+            axis=0,
+            out=self._frame_buffer,
+            mode="clip",
+        )
+
     def activate(self):
+        # Precompute the center offset rotation so assembling a frame only
+        # has to gather into a reused buffer
+        if self._config["center_offset"]:
+            self._frame_perm = np.roll(
+                np.arange(self.pixel_count), self._config["center_offset"]
+            )
+            self._frame_buffer = np.empty((self.pixel_count, 3))
+        else:
+            self._frame_perm = None
+        self._last_frame = None
+        self._frame_interval = 1 / self._config["refresh_rate"]
         self._active = True
         # self._device_thread = Thread(target = self.thread_function)
         # self._device_thread.start()
@@ -323,10 +377,7 @@ class Devices(RegistryLoader):
             device.clear_frame()
 
     def get_device(self, device_id):
-        for device in self.values():
-            if device_id == device.id:
-                return device
-        return None
+        return self.get(device_id)
 
     async def find_wled_devices(self):
         # Scan the LAN network that match WLED using zeroconf - Multicast DNS
@@ -414,14 +465,15 @@ class WLEDListener(zeroconf.ServiceBrowser):
             )
 
             # Update and save the configuration
-            self._ledfx.config["devices"].append(
-                {
-                    "id": device.id,
-                    "type": device.type,
-                    "config": device.config,
-                }
-            )
-            save_config(
-                config=self._ledfx.config,
-                config_dir=self._ledfx.config_dir,
+            device_config = {
+                "id": device.id,
+                "type": device.type,
+                "config": device.config,
+            }
+            self._ledfx.config["devices"].append(device_config)
+            self._ledfx.config["_devices_by_id"][device.id] = device_config
+            # Discovery runs in the zeroconf thread, so hand the save over to
+            # the event loop where saves are serialised
+            self._ledfx.loop.call_soon_threadsafe(
+                self._ledfx.request_config_save
             )
@@ -30,6 +30,18 @@ COLOR_ORDERS = {
 }
 
 
+# Channel order written for each color order. BRG and GBR match the byte
+# swaps the per-pixel implementation performed
+COLOR_ORDER_CHANNELS = {
+    ColorOrder.RGB: [0, 1, 2],
+    ColorOrder.RBG: [0, 2, 1],
+    ColorOrder.GRB: [1, 0, 2],
+    ColorOrder.BRG: [1, 2, 0],
+    ColorOrder.GBR: [2, 0, 1],
+    ColorOrder.BGR: [2, 1, 0],
+}
+
+
 class AvailableCOMPorts:
     ports = serial.tools.list_ports.comports()
 
@@ -57,7 +69,7 @@ class AdalightDevice(Device):
             ): vol.All(vol.Coerce(int), vol.Range(min=1)),
             vol.Required(
                 "color_order", description="Color order", default="RGB"
-            ): vol.In(list(COLOR_ORDERS.keys())),
+            ): vol.In(COLOR_ORDERS.keys()),
         }
     )
 
@@ -88,6 +100,13 @@ class AdalightDevice(Device):
         self.buffer[4] = pixel_count_in_bytes[1]
         self.buffer[5] = self.buffer[3] ^ self.buffer[4] ^ 0x55
 
+        # uint8 view over the pixel section of the buffer so frames can be
+        # converted straight into it
+        self._pixel_data = np.frombuffer(
+            self.buffer, dtype=np.uint8, offset=6
+        ).reshape(self.pixel_count, 3)
+        self._channel_order = COLOR_ORDER_CHANNELS[self.color_order]
+
     def activate(self):
         try:
             self.serial = serial.Serial(self.com_port, self.baudrate)
@@ -110,33 +129,9 @@ class AdalightDevice(Device):
         return int(self._config["pixel_count"])
 
     def flush(self, data):
-
-        byteData = data.astype(np.dtype("B"))
-
-        i = 3
-        for rgb in byteData:
-            i += 3
-            rgb_bytes = rgb.tobytes()
-            self.buffer[i], self.buffer[i + 1], self.buffer[i + 2] = (
-                rgb_bytes[0],
-                rgb_bytes[1],
-                rgb_bytes[2],
-            )
-
-            if self.color_order == ColorOrder.RGB:
-                continue
-            elif self.color_order == ColorOrder.GRB:
-                self.swap(self.buffer, i, i + 1)
-            elif self.color_order == ColorOrder.BGR:
-                self.swap(self.buffer, i, i + 2)
-            elif self.color_order == ColorOrder.RBG:
-                self.swap(self.buffer, i + 1, i + 2)
-            elif self.color_order == ColorOrder.BRG:
-                self.swap(self.buffer, i, i + 1)
-                self.swap(self.buffer, i + 1, i + 2)
-            elif self.color_order == ColorOrder.GBR:
-                self.swap(self.buffer, i, i + 1)
-                self.swap(self.buffer, i, i + 2)
+        np.copyto(
+            self._pixel_data, data[:, self._channel_order], casting="unsafe"
+        )
         try:
             self.serial.write(self.buffer)
 
@@ -145,6 +140,3 @@ class AdalightDevice(Device):
                 "Serial Connection Interrupted. Please check connections and ensure your device is functioning correctly."
             )
             self.deactivate()
-
-    def swap(self, array, pos1, pos2):
-        array[pos1], array[pos2] = array[pos2], array[pos1]
@@ -1,5 +1,8 @@
+import collections
 import logging
 import socket
+import time
+from threading import Event, Thread
 
 import numpy as np
 import voluptuous as vol
@@ -14,6 +17,8 @@ from ledfx.utils import (
 )
 
 _LOGGER = logging.getLogger(__name__)
+# Minimum interval in seconds between logged send errors
+SEND_ERROR_LOG_INTERVAL = 10.0
 
 
 class UDPDevice(Device):
@@ -48,6 +53,8 @@ class UDPDevice(Device):
         }
     )
 
+    _sender = None
+
     def activate(self):
         self.WLEDReceiver = False
         self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
@@ -65,10 +72,13 @@ class UDPDevice(Device):
             self.wled_state = wled_power_state(self.device_ip, self.name)
             if self.wled_state is False:
                 turn_wled_on(self.device_ip, self.name)
+        self._build_packet()
+        self._start_sender()
         super().activate()
 
     def deactivate(self):
         super().deactivate()
+        self._stop_sender()
         if self.WLEDReceiver is True and self.wled_state is False:
             turn_wled_off(self.device_ip, self.name)
         self._sock = None
@@ -78,36 +88,100 @@ class UDPDevice(Device):
         return int(self._config["pixel_count"])
 
     def flush(self, data):
-        udpData = bytearray()
-        byteData = data.astype(np.dtype("B"))
+        # Convert the frame straight into the pixel section of the packet
+        # and hand a snapshot of it to the sender thread
+        np.copyto(self._pixel_data, data, casting="unsafe")
+        self._send_queue.append(bytes(self._packet))
+        self._send_event.set()
+
+    def _start_sender(self):
+        """
+        Starts the thread that owns the socket sends, so a slow send never
+        holds up frame assembly on the event loop. Frames are dropped when
+        the sender falls behind, and sends are non-blocking so a full socket
+        buffer drops frames too
+        """
+        self._destination = (self.device_ip, self._config["port"])
+        self._sock.setblocking(False)
+        self._last_send_error = None
+        # Only the newest frame is worth sending, so the queue holds a single
+        # packet and a new frame replaces one that hasn't been sent yet
+        self._send_queue = collections.deque(maxlen=1)
+        self._send_event = Event()
+        self._sender_active = True
+        self._sender = Thread(target=self._send_loop, daemon=True)
+        self._sender.start()
 
-        # Append the prefix if provided
-        prefix = self._config.get("data_prefix")
-        if prefix:
+    def _stop_sender(self):
+        if self._sender is None:
+            return
+        self._sender_active = False
+        self._send_event.set()
+        self._sender.join()
+        self._sender = None
+
+    def _send_loop(self):
+        while True:
+            self._send_event.wait()
+            self._send_event.clear()
+            # Send the pending frame if there is one. This still sends the
+            # final cleared frame when the device is deactivated
             try:
-                udpData.extend(bytes.fromhex(prefix))
-            except ValueError:
-                _LOGGER.warning(f"Cannot convert prefix {prefix} to hex value")
+                packet = self._send_queue.popleft()
+            except IndexError:
+                packet = None
+            if packet is not None:
+                try:
+                    self._sock.sendto(packet, self._destination)
+                except BlockingIOError:
+                    # The socket buffer is full, a late frame is worse than
+                    # a missing one so just drop it
+                    pass
+                except OSError as error:
+                    # Network errors such as the network going down must not
+                    # kill the sender, so log them and keep going
+                    self._log_send_error(error)
+            if not self._sender_active:
+                break
+
+    def _log_send_error(self, error):
+        """Logs send errors at most once every SEND_ERROR_LOG_INTERVAL"""
+        now = time.monotonic()
+        if (
+            self._last_send_error is None
+            or now - self._last_send_error >= SEND_ERROR_LOG_INTERVAL
+        ):
+            self._last_send_error = now
+            _LOGGER.warning(f"Failed to send to device {self.name}: {error}")
 
-        # Append all of the pixel data
+    def _build_packet(self):
+        """
+        Preallocates the datagram with the prefix, postfix and indexes
+        filled in, leaving a uint8 view over the pixel bytes for flush
+        """
+        prefix = self._hex_config("data_prefix", "prefix")
+        postfix = self._hex_config("data_postfix", "postfix")
+        channels = 4 if self._config["include_indexes"] else 3
+        pixel_bytes = channels * self.pixel_count
+
+        self._packet = bytearray(len(prefix) + pixel_bytes + len(postfix))
+        self._packet[: len(prefix)] = prefix
+        self._packet[len(prefix) + pixel_bytes :] = postfix
+
+        pixel_data = np.frombuffer(
+            self._packet, dtype=np.uint8, count=pixel_bytes, offset=len(prefix)
+        ).reshape(self.pixel_count, channels)
         if self._config["include_indexes"]:
-            for i in range(len(byteData)):
-                udpData.extend(bytes([i]))
-                udpData.extend(byteData[i].flatten().tobytes())
-        else:
-            udpData.extend(byteData.flatten().tobytes())
-
-        # Append the postfix if provided
-        postfix = self._config.get("data_postfix")
-        if postfix:
-            try:
-                udpData.extend(bytes.fromhex(postfix))
-            except ValueError:
-                _LOGGER.warning(
-                    f"Cannot convert postfix {postfix} to hex value"
-                )
-
-        self._sock.sendto(
-            bytes(udpData),
-            (self.device_ip, self._config["port"]),
-        )
+            pixel_data[:, 0] = np.arange(self.pixel_count) % 256
+            pixel_data = pixel_data[:, 1:]
+        self._pixel_data = pixel_data
+
+    def _hex_config(self, key, label):
+        value = self._config.get(key)
+        if not value:
+            return b""
+        try:
+            return bytes.fromhex(value)
+        except ValueError:
+            _LOGGER.warning(f"Cannot convert {label} {value} to hex value")
+            return b""
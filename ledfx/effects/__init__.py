@@ -1,5 +1,5 @@
-import colorsys
 import logging
+from collections import OrderedDict
 
 # from ledfx.effects.audio import FREQUENCY_RANGES
 from functools import lru_cache
@@ -8,9 +8,10 @@ import numpy as np
 import voluptuous as vol
 
 from ledfx.color import COLORS
-from ledfx.utils import BaseRegistry, RegistryLoader
+from ledfx.utils import BaseRegistry, RegistryLoader, deepfreeze
 
 _LOGGER = logging.getLogger(__name__)
+VALIDATED_CONFIG_CACHE_SIZE = 32
 
 
 def mix_colors(color_1, color_2, ratio):
@@ -34,15 +35,51 @@ def fill_solid(pixels, color):
     ] = color
 
 
+def fill_aligned(pixels, value, length, align):
+    """
+    Fills length pixels with value, placed according to the alignment
+    ("left", "right", "center" or "invert")
+    """
+    size = len(pixels)
+    length = min(length, size)
+    if align == "center":
+        start = (size - length) // 2
+        pixels[start : start + length] = value
+    elif align == "invert":
+        # Split the block across both ends
+        tail = (length + 1) // 2
+        pixels[: length - tail] = value
+        pixels[size - tail :] = value
+    elif align == "right":
+        pixels[size - length :] = value
+    else:
+        pixels[:length] = value
+
+
+# Which of (v, q, p, t) makes up the red, green and blue channels for each
+# of the six hue sectors, matching colorsys.hsv_to_rgb
+_HSV_SECTOR_CHANNELS = np.array(
+    [[0, 3, 2], [1, 0, 2], [2, 0, 3], [2, 1, 0], [3, 2, 0], [0, 2, 1]]
+)
+
+
 def fill_rainbow(pixels, initial_hue, delta_hue):
-    hue = initial_hue
     sat = 0.95
     val = 1.0
-    for i in range(0, len(pixels)):
-        pixels[i, :] = tuple(
-            int(i * 255) for i in colorsys.hsv_to_rgb(hue, sat, val)
-        )
-        hue = hue + delta_hue
+    hue = initial_hue + delta_hue * np.arange(len(pixels))
+
+    # Vectorised colorsys.hsv_to_rgb over the whole strip
+    sector = np.floor(hue * 6.0)
+    frac = hue * 6.0 - sector
+    channels = np.empty((len(pixels), 4))
+    channels[:, 0] = val
+    channels[:, 1] = val * (1.0 - sat * frac)
+    channels[:, 2] = val * (1.0 - sat)
+    channels[:, 3] = val * (1.0 - sat * (1.0 - frac))
+    rgb = np.take_along_axis(
+        channels, _HSV_SECTOR_CHANNELS[sector.astype(int) % 6], axis=1
+    )
+    pixels[:] = np.trunc(rgb * 255)
     return pixels
 
 
@@ -202,10 +239,23 @@ class Effect(BaseRegistry):
                 "background_color",
                 description="Apply a background colour",
                 default="black",
-            ): vol.In(list(COLORS.keys())),
+            ): vol.In(COLORS.keys()),
         }
     )
 
+    def __init_subclass__(cls, **kwargs):
+        """Collects the config_updated implementations for the class"""
+        super().__init_subclass__(**kwargs)
+
+        cls._validated_configs = OrderedDict()
+
+        # Base classes are notified first, then the class itself
+        cls._config_updated_hooks = [
+            klass.config_updated
+            for klass in cls.__mro__[1:] + (cls,)
+            if klass is not Effect and "config_updated" in vars(klass)
+        ]
+
     def __init__(self, ledfx, config):
         self._ledfx = ledfx
         self._dirty_callback = None
@@ -231,25 +281,28 @@ class Effect(BaseRegistry):
 
     def update_config(self, config):
         # TODO: Sync locks to ensure everything is thread safe
-        validated_config = type(self).schema()(config)
-        self._config = validated_config
+        # UI saves often resend an unchanged config, so reuse the result of
+        # validating an identical config for this effect class. The key is
+        # typed, as the schema coerces and rejects values by type.
+        cache = type(self)._validated_configs
+        config_key = deepfreeze(config, typed=True)
+        validated_config = cache.get(config_key)
+        if validated_config is None:
+            validated_config = type(self).schema()(config)
+            if len(cache) >= VALIDATED_CONFIG_CACHE_SIZE:
+                cache.popitem(last=False)
+            cache[config_key] = validated_config
+        else:
+            cache.move_to_end(config_key)
+        self._config = dict(validated_config)
 
         self._bg_color = np.array(
             COLORS[self._config["background_color"]], dtype=float
         )
 
-        def inherited(cls, method):
-            if hasattr(cls, method) and hasattr(super(cls, cls), method):
-                return cls.foo == super(cls).foo
-            return False
-
-        # Iterate all the base classes and check to see if there is a custom
-        # implementation of config updates. If to notify the base class.
-        valid_classes = list(type(self).__bases__)
-        valid_classes.append(type(self))
-        for base in valid_classes:
-            if base.config_updated != super(base, base).config_updated:
-                base.config_updated(self, self._config)
+        # Notify every class with a custom implementation of config updates
+        for config_updated in self._config_updated_hooks:
+            config_updated(self, self._config)
 
         _LOGGER.info(
             f"Effect {self.NAME} config updated to {validated_config}."
@@ -273,7 +326,12 @@ class Effect(BaseRegistry):
         return self._active
 
     def get_pixels(self):
-        return self.pixels
+        """
+        Returns the current frame without copying it. The pixels setter
+        always rebinds _pixels to a new array, so the frame handed out
+        here is never modified by the effect afterwards
+        """
+        return self._pixels
 
     @property
     def pixels(self):
@@ -303,13 +361,15 @@ class Effect(BaseRegistry):
                 pixels = flip_pixels(pixels)
             if self._config["mirror"]:
                 pixels = mirror_pixels(pixels)
-            if self._config["background_color"]:
+            # A black background adds nothing, so skip the blend entirely
+            if self._bg_color.any():
                 # TODO: colours in future should have an alpha value, which would work nicely to apply to dim the background colour
                 # for now, just set it a bit less bright.
                 bg_brightness = np.max(pixels, axis=1)
                 bg_brightness = (255 - bg_brightness) / 510
-                _bg_color_array = np.tile(self._bg_color, (len(pixels), 1))
-                pixels += np.multiply(_bg_color_array.T, bg_brightness).T
+                # Broadcast the colour over the rows rather than tiling and
+                # transposing a full frame
+                pixels += bg_brightness[:, np.newaxis] * self._bg_color
             if self._config["brightness"] is not None:
                 pixels = brightness_pixels(pixels, self._config["brightness"])
             # If the configured blur is greater than 0 we need to blur it
@@ -2,6 +2,7 @@ import numpy as np
 import voluptuous as vol
 
 from ledfx.color import COLORS, GRADIENTS
+from ledfx.effects import fill_aligned
 from ledfx.effects.audio import AudioReactiveEffect
 from ledfx.effects.gradient import GradientEffect
 
@@ -24,7 +25,7 @@ class BandsAudioEffect(AudioReactiveEffect, GradientEffect):
                 "gradient_name",
                 description="Color gradient to display",
                 default="Rainbow",
-            ): vol.In(list(GRADIENTS.keys())),
+            ): vol.In(GRADIENTS.keys()),
             vol.Optional(
                 "mirror",
                 description="Mirror the effect",
@@ -56,17 +57,9 @@ class BandsAudioEffect(AudioReactiveEffect, GradientEffect):
             color = self.get_gradient_color(i / self._config["band_count"])
             vol = int(out_split[i].max() * band_width)  # length (vol) of band
             out_split[i][:] = self.bkg_color
-            if vol:
-                out_split[i][:vol] = color
-            if self._config["align"] == "center":
-                out_split[i] = np.roll(
-                    out_split[i], (band_width - vol) // 2, axis=0
-                )
-            elif self._config["align"] == "invert":
-                out_split[i] = np.roll(out_split[i], -vol // 2, axis=0)
-            elif self._config["align"] == "right":
-                out_split[i] = np.flip(out_split[i], axis=0)
-            elif self._config["align"] == "left":
-                pass
+            # Write the band straight into place rather than rolling it
+            fill_aligned(out_split[i], color, vol, self._config["align"])
 
-        self.pixels = np.vstack(out_split)
+        # The bands are views into the clipped output, so it already holds
+        # the assembled frame
+        self.pixels = out_clipped
@@ -18,7 +18,7 @@ class BandsMatrixAudioEffect(AudioReactiveEffect, GradientEffect):
                 "gradient_name",
                 description="Color gradient to display",
                 default="Rainbow",
-            ): vol.In(list(GRADIENTS.keys())),
+            ): vol.In(GRADIENTS.keys()),
             vol.Optional(
                 "mirror",
                 description="Mirror the effect",
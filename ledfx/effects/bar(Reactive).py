@@ -15,7 +15,7 @@ class BarAudioEffect(AudioReactiveEffect, GradientEffect):
                 "gradient_name",
                 description="Color scheme to cycle through",
                 default="Rainbow",
-            ): vol.In(list(GRADIENTS.keys())),
+            ): vol.In(GRADIENTS.keys()),
             vol.Optional(
                 "mode",
                 description="Choose from different animations",
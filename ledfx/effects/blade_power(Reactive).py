@@ -30,18 +30,25 @@ class BladePowerAudioEffect(AudioReactiveEffect):
                 "background_color",
                 description="Color of Background",
                 default="orange",
-            ): vol.In(list(COLORS.keys())),
+            ): vol.In(COLORS.keys()),
             vol.Optional(
                 "color", description="Color of bar", default="brown"
-            ): vol.In(list(COLORS.keys())),
+            ): vol.In(COLORS.keys()),
             vol.Optional(
                 "frequency_range",
                 description="Frequency range for the beat detection",
                 default="Bass (60-250Hz)",
-            ): vol.In(list(FREQUENCY_RANGES.keys())),
+            ): vol.In(FREQUENCY_RANGES.keys()),
         }
     )
 
+    def activate(self, pixel_count):
+        # Allocate the frame buffer before subscribing to audio so the
+        # callback never runs without it
+        self._out = np.zeros((pixel_count, 3))
+        self._last_bar_idx = None
+        super().activate(pixel_count)
+
     def config_updated(self, config):
 
         # Create the filters used for the effect
@@ -52,18 +59,28 @@ class BladePowerAudioEffect(AudioReactiveEffect):
             FREQUENCY_RANGES[self.config["frequency_range"]].max,
             20,
         )
+        # Force the next frame to render with the new config
+        self._last_bar_idx = None
 
     def audio_data_updated(self, data):
         # Get frequency range power through filter
-        out = np.zeros(np.shape(self.pixels))
         bar = (
-            np.max(data.sample_melbank(list(self._frequency_range)))
+            np.max(data.sample_melbank(self._frequency_range))
             * self.config["multiplier"]
         )
         bar = self._bar_filter.update(bar)
         # Map it to the length of the strip and apply it
-        bar_idx = int(bar * self.pixel_count)
+        out = self._out
+        bar_idx = int(bar * len(out))
+
+        # The frame only depends on the bar length, so when that hasn't
+        # moved leave the effect clean and let the device skip the frame
+        if bar_idx == self._last_bar_idx:
+            return
+        self._last_bar_idx = bar_idx
+
         out[:bar_idx] = self.bar_color
+        out[bar_idx:] = 0
 
         # Update the pixels
         self.pixels = out
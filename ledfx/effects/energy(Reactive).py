@@ -29,17 +29,17 @@ class EnergyAudioEffect(AudioReactiveEffect):
                 "color_lows",
                 description="Color of low, bassy sounds",
                 default="red",
-            ): vol.In(list(COLORS.keys())),
+            ): vol.In(COLORS.keys()),
             vol.Optional(
                 "color_mids",
                 description="Color of midrange sounds",
                 default="green",
-            ): vol.In(list(COLORS.keys())),
+            ): vol.In(COLORS.keys()),
             vol.Optional(
                 "color_high",
                 description="Color of high sounds",
                 default="blue",
-            ): vol.In(list(COLORS.keys())),
+            ): vol.In(COLORS.keys()),
             vol.Optional(
                 "sensitivity",
                 description="Responsiveness to changes in sound",
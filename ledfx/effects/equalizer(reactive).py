@@ -2,6 +2,7 @@ import numpy as np
 import voluptuous as vol
 
 from ledfx.color import GRADIENTS
+from ledfx.effects import fill_aligned
 from ledfx.effects.audio import AudioReactiveEffect
 from ledfx.effects.gradient import GradientEffect
 
@@ -21,7 +22,7 @@ class EQAudioEffect(AudioReactiveEffect, GradientEffect):
                 "gradient_name",
                 description="Color gradient to display",
                 default="Rainbow",
-            ): vol.In(list(GRADIENTS.keys())),
+            ): vol.In(GRADIENTS.keys()),
             vol.Optional(
                 "gradient_repeat",
                 description="Repeat the gradient into segments",
@@ -54,17 +55,9 @@ class EQAudioEffect(AudioReactiveEffect, GradientEffect):
             # length (volume) of band
             volume = int(r_split[i].sum() * band_width)
             r_split[i][:] = 0
-            if volume:
-                r_split[i][:volume] = 1
-            if self._config["align"] == "center":
-                r_split[i] = np.roll(
-                    r_split[i], (band_width - volume) // 2, axis=0
-                )
-            elif self._config["align"] == "invert":
-                r_split[i] = np.roll(r_split[i], -volume // 2, axis=0)
-            elif self._config["align"] == "right":
-                r_split[i] = np.flip(r_split[i], axis=0)
-            elif self._config["align"] == "left":
-                pass
+            # Write the band straight into place rather than rolling it
+            fill_aligned(r_split[i], 1, volume, self._config["align"])
 
-        self.pixels = self.apply_gradient(np.hstack(r_split))
+        # The bands are views into the clipped input, so it already holds
+        # the assembled bands
+        self.pixels = self.apply_gradient(r_clipped)
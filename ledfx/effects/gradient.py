@@ -25,7 +25,7 @@ class GradientEffect(Effect):
                 "gradient_name",
                 description="Color gradient to display",
                 default="Rainbow",
-            ): vol.In(list(GRADIENTS.keys())),
+            ): vol.In(GRADIENTS.keys()),
             vol.Optional(
                 "gradient_roll",
                 description="Amount to shift the gradient",
@@ -43,6 +43,7 @@ class GradientEffect(Effect):
     )
 
     _gradient_curve = None
+    _gradient_roll_buffer = None
 
     def _comb(self, N, k):
         N = int(N)
@@ -165,11 +166,20 @@ class GradientEffect(Effect):
         if self._config["gradient_roll"] == 0:
             return
 
-        self._gradient_curve = np.roll(
-            self._gradient_curve,
-            self._config["gradient_roll"],
-            axis=1,
-        )
+        gradient_length = self._gradient_curve.shape[1]
+        shift = self._config["gradient_roll"] % gradient_length
+        if shift == 0:
+            return
+
+        # Rotate into a reusable buffer and swap the two, rather than having
+        # np.roll allocate a new gradient curve every frame
+        buffer = self._gradient_roll_buffer
+        if buffer is None or buffer.shape != self._gradient_curve.shape:
+            buffer = np.empty_like(self._gradient_curve)
+        buffer[:, :shift] = self._gradient_curve[:, -shift:]
+        buffer[:, shift:] = self._gradient_curve[:, :-shift]
+        self._gradient_roll_buffer = self._gradient_curve
+        self._gradient_curve = buffer
 
     def get_gradient_color(self, point):
         self._validate_gradient()
@@ -14,7 +14,7 @@ class MagnitudeAudioEffect(AudioReactiveEffect, GradientEffect):
                 "frequency_range",
                 description="Frequency range for the beat detection",
                 default="Bass (60-250Hz)",
-            ): vol.In(list(FREQUENCY_RANGES.keys())),
+            ): vol.In(FREQUENCY_RANGES.keys()),
         }
     )
 
@@ -28,7 +28,7 @@ class MagnitudeAudioEffect(AudioReactiveEffect, GradientEffect):
     def audio_data_updated(self, data):
 
         # Grab the filtered and interpolated melbank data
-        magnitude = np.max(data.sample_melbank(list(self._frequency_range)))
+        magnitude = np.max(data.sample_melbank(self._frequency_range))
         if magnitude > 1.0:
             magnitude = 1.0
         self.pixels = self.apply_gradient(magnitude)
@@ -66,8 +66,8 @@ class ModulateEffect(Effect):
             overlay = np.linspace(
                 self._counter + np.pi, self._counter, self.pixel_count
             )
-            overlay = np.tile(0.3 * np.sin(overlay) + 0.4, (3, 1)).T
-            return pixels * overlay
+            overlay = 0.3 * np.sin(overlay) + 0.4
+            return pixels * overlay[:, np.newaxis]
 
         elif self._config["modulation_effect"] == "breath":
             self._counter += self._config["modulation_speed"]
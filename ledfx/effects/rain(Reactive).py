@@ -26,17 +26,17 @@ class RainAudioEffect(AudioReactiveEffect):
                 "lows_colour",
                 description="Colour for low sounds, ie beats",
                 default="white",
-            ): vol.In(list(COLORS.keys())),
+            ): vol.In(COLORS.keys()),
             vol.Optional(
                 "mids_colour",
                 description="Colour for mid sounds, ie vocals",
                 default="red",
-            ): vol.In(list(COLORS.keys())),
+            ): vol.In(COLORS.keys()),
             vol.Optional(
                 "high_colour",
                 description="Colour for high sounds, ie hi hat",
                 default="blue",
-            ): vol.In(list(COLORS.keys())),
+            ): vol.In(COLORS.keys()),
             vol.Optional(
                 "lows_sensitivity",
                 description="Sensitivity to low sounds",
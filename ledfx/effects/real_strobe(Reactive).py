@@ -18,7 +18,7 @@ class Strobe(AudioReactiveEffect, GradientEffect):
                 "gradient_name",
                 description="Color scheme for bass strobe to cycle through",
                 default="Dancefloor",
-            ): vol.In(list(GRADIENTS.keys())),
+            ): vol.In(GRADIENTS.keys()),
             vol.Optional(
                 "color_step",
                 description="Amount of color change per bass strobe",
@@ -38,7 +38,7 @@ class Strobe(AudioReactiveEffect, GradientEffect):
                 "strobe_color",
                 description="Colour for note strobes",
                 default="white",
-            ): vol.In(list(COLORS.keys())),
+            ): vol.In(COLORS.keys()),
             vol.Optional(
                 "strobe_width",
                 description="Note strobe width, in pixels",
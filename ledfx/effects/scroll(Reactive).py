@@ -38,17 +38,17 @@ class ScrollAudioEffect(AudioReactiveEffect):
                 "color_lows",
                 description="Color of low, bassy sounds",
                 default="red",
-            ): vol.In(list(COLORS.keys())),
+            ): vol.In(COLORS.keys()),
             vol.Optional(
                 "color_mids",
                 description="Color of midrange sounds",
                 default="green",
-            ): vol.In(list(COLORS.keys())),
+            ): vol.In(COLORS.keys()),
             vol.Optional(
                 "color_high",
                 description="Color of high sounds",
                 default="blue",
-            ): vol.In(list(COLORS.keys())),
+            ): vol.In(COLORS.keys()),
         }
     )
 
@@ -13,13 +13,20 @@ class SingleColorEffect(TemporalEffect, ModulateEffect):
         {
             vol.Optional(
                 "color", description="Color of strip", default="red"
-            ): vol.In(list(COLORS.keys())),
+            ): vol.In(COLORS.keys()),
         }
     )
 
+    def activate(self, pixel_count):
+        # The effect thread starts in super().activate, so the frame buffer
+        # has to exist before then
+        self._color_array = np.zeros((pixel_count, 3))
+        super().activate(pixel_count)
+
     def config_updated(self, config):
         self.color = np.array(COLORS[self._config["color"]], dtype=float)
 
     def effect_loop(self):
-        color_array = np.tile(self.color, (self.pixel_count, 1))
+        color_array = self._color_array
+        color_array[:] = self.color
         self.pixels = self.modulate(color_array)
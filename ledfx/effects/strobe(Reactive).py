@@ -12,7 +12,7 @@ class Strobe(AudioReactiveEffect):
         {
             vol.Optional(
                 "color", description="Strobe colour", default="white"
-            ): vol.In(list(COLORS.keys())),
+            ): vol.In(COLORS.keys()),
             vol.Optional(
                 "frequency",
                 description="Strobe frequency",
@@ -30,7 +30,7 @@ class TemporalEffect(Effect):
     def thread_function(self):
 
         while self._thread_active:
-            startTime = time.time()
+            startTime = time.monotonic()
 
             # Treat the return value of the effect loop as a speed modifier
             # such that effects that are naturally faster or slower can have
@@ -43,7 +43,7 @@ class TemporalEffect(Effect):
             # Calculate the time to sleep accounting for potential heavy
             # frame assembly operations
             timeToSleep = (sleepInterval / self._config["speed"]) - (
-                time.time() - startTime
+                time.monotonic() - startTime
             )
             if timeToSleep > 0:
                 time.sleep(timeToSleep)
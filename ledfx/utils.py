@@ -322,6 +322,23 @@ def generate_title(id):
     return re.sub("[^a-zA-Z0-9]", " ", id).title()
 
 
+def deepfreeze(obj, typed=False):
+    """
+    Converts nested dicts and lists into a hashable equivalent. If typed is
+    set, values of different types are kept apart, so 1, 1.0 and True or a
+    list and a tuple don't freeze to equal keys.
+    """
+    if isinstance(obj, dict):
+        frozen = frozenset(
+            (key, deepfreeze(value, typed)) for key, value in obj.items()
+        )
+    elif isinstance(obj, (list, tuple)):
+        frozen = tuple(deepfreeze(value, typed) for value in obj)
+    else:
+        frozen = obj
+    return (type(obj), frozen) if typed else frozen
+
+
 def hasattr_explicit(cls, attr):
     """Returns if the given object has explicitly declared an attribute"""
     try:
@@ -351,12 +368,20 @@ def getattr_explicit(cls, attr, *default):
 
 
 class RollingQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queues log records into a bounded deque, which drops the oldest record
+    when full, and sets an event in the loop to wake up any consumers
+    """
+
+    def __init__(self, queue, event, loop):
+        super().__init__(queue)
+        self._event = event
+        self._loop = loop
+
     def enqueue(self, record):
-        try:
-            self.queue.put_nowait(record)
-        except asyncio.QueueFull:
-            self.queue.get_nowait()
-            self.enqueue(record)
+        self.queue.append(record)
+        if not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._event.set)
 
 
 class BaseRegistry(ABC):
@@ -399,6 +424,16 @@ class BaseRegistry(ABC):
                 type(self), self._schema_attr, vol.Schema({})
             )
 
+        # The extended schema only depends on the class hierarchy, so build
+        # it once per class. Look in the class's own dict so subclasses
+        # never pick up a parent's cache
+        schema_cache = vars(self).get("_extended_schema_cache")
+        if schema_cache is None:
+            schema_cache = {}
+            setattr(self, "_extended_schema_cache", schema_cache)
+        elif extra in schema_cache:
+            return schema_cache[extra]
+
         schema = vol.Schema({}, extra=extra)
         classes = inspect.getmro(self)[::-1]
         for c in classes:
@@ -406,6 +441,7 @@ class BaseRegistry(ABC):
             if c_schema is not None:
                 schema = schema.extend(c_schema.schema)
 
+        schema_cache[extra] = schema
         return schema
 
     @classmethod
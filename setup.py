@@ -43,6 +43,11 @@ INSTALL_REQUIRES = [
     "pyserial>=3.5",
 ]
 
+# Optional faster JSON serialisation for the API and the config file
+EXTRAS_REQUIRE = {
+    "fast": ["orjson>=3.5.0"],
+}
+
 setup(
     name=PROJECT_PACKAGE_NAME,
     version=PROJECT_VERSION,
@@ -59,6 +64,7 @@ setup(
         "Discord": "https://discord.gg/PqXMuthSNx",
     },
     install_requires=INSTALL_REQUIRES,
+    extras_require=EXTRAS_REQUIRE,
     setup_requires=SETUP_REQUIRES,
     python_requires=const.REQUIRED_PYTHON_STRING,
     entry_points={"console_scripts": ["ledfx = ledfx.__main__:main"]},